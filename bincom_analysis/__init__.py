@@ -0,0 +1,45 @@
+#  Bincom ICT Solutions.
+#  Python Basic Developer Test
+#
+#  T-shirt color analysis: scraping the weekly HTML export, computing the
+#  color statistics, storing the frequencies, and the algorithmic questions.
+#  The _t-shirt_analysis*.py scripts are thin entry points over this package.
+
+from .scraping import get_html_file_path, scrape_color_data, scrape_color_counts_parallel
+from .stats import compute_color_stats, print_color_stats, analyze_colors, analyze_colors_from_database
+from .storage import (
+    StorageBackend,
+    PostgresBackend,
+    SQLiteBackend,
+    STORAGE_BACKENDS,
+    load_db_config,
+    get_storage_backend,
+    connect_storage_backend,
+    save_to_database,
+)
+from .watch import DirectoryWatcher, watch_directory
+from .algorithms import recursive_search, generate_and_convert_binary, sum_fibonacci, run_algorithms
+
+__all__ = [
+    'get_html_file_path',
+    'scrape_color_data',
+    'scrape_color_counts_parallel',
+    'compute_color_stats',
+    'print_color_stats',
+    'analyze_colors',
+    'analyze_colors_from_database',
+    'StorageBackend',
+    'PostgresBackend',
+    'SQLiteBackend',
+    'STORAGE_BACKENDS',
+    'load_db_config',
+    'get_storage_backend',
+    'connect_storage_backend',
+    'save_to_database',
+    'DirectoryWatcher',
+    'watch_directory',
+    'recursive_search',
+    'generate_and_convert_binary',
+    'sum_fibonacci',
+    'run_algorithms',
+]
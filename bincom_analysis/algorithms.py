@@ -0,0 +1,84 @@
+#  Part 2: Algorithmic Questions
+
+import random
+
+
+#TODO: 7. write a recursive searching algorithm
+def recursive_search(arr, target, index=0):
+    """
+    Recursively searches for a target value in a list.
+
+    Args:
+        arr (list): The list to search in.
+        target: The value to search for.
+        index (int): The current index to check.
+
+    Returns:
+        int: The index of the target if found, otherwise -1.
+    """
+    if index >= len(arr):
+        return -1
+    if arr[index] == target:
+        return index
+    return recursive_search(arr, target, index + 1)
+
+#TODO: 8. Write a program that generates random 4 digits number of 0s and 1s and convert the generated number to base 10.
+def generate_and_convert_binary():
+    """
+    Generates a random 4-digit binary number and converts it to decimal.
+
+    Returns:
+        tuple: The binary string and its decimal equivalent.
+    """
+    binary_number = "".join(random.choice('01') for _ in range(4))
+    decimal_number = int(binary_number, 2)
+    return binary_number, decimal_number
+
+#TODO: 9. Write a program to sum the first 50 fibonacci sequence.
+def sum_fibonacci(n):
+    """Calculates the sum of the first n Fibonacci numbers."""
+    if n <= 0:
+        return 0
+    a, b, fib_sum = 0, 1, 0
+    for _ in range(n):
+        fib_sum += a
+        a, b = b, a + b
+    return fib_sum
+
+def run_algorithms(target_num=None):
+    """
+    Runs the algorithmic questions and prints their results.
+
+    Args:
+        target_num (int): Number to look for in the recursive search. If None,
+            the user is asked for one.
+    """
+    print("\n--- Algorithmic Questions ---")
+
+    # 7. Recursive search
+    print("7. Recursive Search:")
+    search_list = [10, 25, 8, 42, 15, 30, 5]
+    try:
+        if target_num is None:
+            target_input = input(f"   Enter a number to search for in the list {search_list}: ")
+            target_num = int(target_input)
+        else:
+            print(f"   Searching for {target_num} in {search_list}")
+        result_index = recursive_search(search_list, target_num)
+        if result_index != -1:
+            print(f"   -> Found at index: {result_index}")
+        else:
+            print(f"   -> {target_num} was not found.")
+    except ValueError:
+        print("   -> Invalid input. Please enter an integer.")
+
+    # 8. Random binary number
+    print("\n8. Random Binary to Decimal Conversion:")
+    binary_num, decimal_num = generate_and_convert_binary()
+    print(f"   Random 4-digit binary: {binary_num}")
+    print(f"   -> Converted to decimal (base 10): {decimal_num}")
+
+    # 9. Fibonacci sum
+    print("\n9. Sum of the first 50 Fibonacci numbers:")
+    fib_sum_50 = sum_fibonacci(50)
+    print(f"   -> The sum is: {fib_sum_50}")
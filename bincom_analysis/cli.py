@@ -0,0 +1,58 @@
+#  Command line entry point shared by the t-shirt analysis scripts.
+
+import argparse
+
+from .algorithms import run_algorithms
+from .scraping import get_html_file_path, scrape_color_counts_parallel, scrape_color_data
+from .stats import analyze_colors
+from .watch import watch_directory
+
+
+def main(argv=None):
+    """Parses the command line, runs the color analysis and then the algorithms."""
+    parser = argparse.ArgumentParser(description="Bincom T-shirt color analysis.")
+    parser.add_argument('html_file', nargs='?',
+                        help="HTML file to analyze (asked for interactively if omitted)")
+    parser.add_argument('--from-db', action='store_true',
+                        help="analyze the frequencies already stored in the database "
+                             "instead of scraping an HTML file")
+    parser.add_argument('--accumulate', action='store_true',
+                        help="add the scraped frequencies to those already stored "
+                             "instead of replacing them")
+    parser.add_argument('--workers', type=int,
+                        help="scrape the HTML file in parallel chunks using this many processes")
+    parser.add_argument('--watch', metavar='DIRECTORY',
+                        help="keep watching DIRECTORY and re-analyze HTML files as they "
+                             "are added or changed")
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help="seconds to wait for a burst of file changes to settle (default: 2)")
+    parser.add_argument('--max-wait', type=float, default=30.0,
+                        help="seconds after which a batch is written even if files keep "
+                             "changing (default: 30)")
+    parser.add_argument('--search-target', type=int,
+                        help="number for the recursive search (asked for if omitted)")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.debounce < 0:
+        parser.error("--debounce must not be negative")
+    if args.max_wait < 0:
+        parser.error("--max-wait must not be negative")
+
+    if args.watch:
+        watch_directory(args.watch, debounce=args.debounce, max_wait=args.max_wait)
+        return
+
+    # Part 1: Data Scraping and Analysis
+    if args.from_db:
+        analyze_colors(from_database=True)
+    else:
+        html_file_path = args.html_file or get_html_file_path()
+        if args.workers:
+            shirt_colors = scrape_color_counts_parallel(html_file_path, args.workers)
+        else:
+            shirt_colors = scrape_color_data(html_file_path)
+        analyze_colors(shirt_colors, accumulate=args.accumulate)
+
+    # Part 2: Run algorithms
+    run_algorithms(args.search_target)
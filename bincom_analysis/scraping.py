@@ -0,0 +1,249 @@
+#  Part 1: Data Scraping
+#
+#  Reads the weekly HTML export and extracts the comma-separated colors
+#  from the second column of the table.
+
+import bisect
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+
+def get_html_file_path():
+    """
+    Prompts the user for a file path and validates it using pathlib.
+
+    Returns:
+        pathlib.Path: A validated path object to an existing .html file.
+    """
+    while True:
+        try:
+            input_path = input("Enter the path to the HTML file (e.g., python_class_question.html): ")
+            # Create a Path object for robust path handling
+            file_path = Path(input_path)
+
+            # 1. Check if the path exists and is a file
+            if not file_path.is_file():
+                print(f"Error: The file '{file_path}' does not exist. Please try again.")
+                continue
+
+            # 2. Check if the file has a .html extension
+            if file_path.suffix.lower() != '.html':
+                print(f"Error: The file must have an '.html' extension. You provided: '{file_path.suffix}'")
+                continue
+
+            # If all checks pass, return the valid path
+            return file_path
+
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}. Please try again.")
+
+
+def _colors_from_rows(rows):
+    """Extracts the colors from the second cell of each table row."""
+    all_colors = []
+    for row in rows:
+        cells = row.find_all('td')
+        if len(cells) > 1:
+            color_data = cells[1].text
+            colors = [color.strip().upper() for color in color_data.split(',')]
+            all_colors.extend(colors)
+
+    return [color for color in all_colors if color] # Filter out empty strings
+
+def _read_colors(file_path):
+    """
+    Reads and parses the HTML file, raising instead of exiting on bad input.
+
+    Raises:
+        ValueError: If the file has no '<table>' element.
+        OSError, UnicodeDecodeError: If the file cannot be read.
+    """
+    with Path(file_path).open('r', encoding='utf-8') as f:
+        contents = f.read()
+
+    soup = BeautifulSoup(contents, 'html.parser')
+
+    if not soup.find('table'):
+        raise ValueError(f"No '<table>' element found in '{file_path}'. Cannot scrape data.")
+
+    rows = soup.find('table').find_all('tr')
+    return _colors_from_rows(rows[1:]) # Skip header row
+
+def scrape_color_data(file_path):
+    """
+    Scrapes color data from the provided HTML file.
+
+    Args:
+        file_path (str or pathlib.Path): The path to the HTML file.
+
+    Returns:
+        list: A list of all color strings, or exits the script on error.
+    """
+    file_path = Path(file_path)
+    if not file_path.is_file():
+        print(f"Error: The file '{file_path}' was not found.")
+        sys.exit(1)
+
+    try:
+        return _read_colors(file_path)
+
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading or parsing the file '{file_path}': {e}")
+        sys.exit(1)
+
+
+# --- Parallel scraping of a single large file ---
+
+# Tokens that matter for splitting: comments, processing instructions, CDATA
+# sections and script/style bodies (whose contents html.parser does not treat
+# as tags) and <table>/<tr> tags. A processing instruction ends at its first
+# '>', as in html.parser. Any other '<![' marked section is left to the serial scrape.
+_SPLIT_TOKEN_RE = re.compile(rb"""
+    (?P<comment><!--.*?-->)
+  | (?P<pi><\?[^>]*>)
+  | (?P<cdata><!\[CDATA\[.*?\]\s*\]\s*>)
+  | (?P<raw><(?P<raw_tag>script|style)[\s>].*?</(?P=raw_tag)\s*>)
+  | (?P<unterminated><!--|<\?|<!\[|<(?:script|style)[\s>])
+  | <(?P<closing>/?)(?P<tag>table|tr)(?=[\s/>])
+""", re.IGNORECASE | re.DOTALL | re.VERBOSE)
+
+# Below this many bytes per chunk, process start-up costs more than it saves.
+MIN_CHUNK_BYTES = 1 << 20
+
+
+def _count_colors_in_range(file_path, start, end):
+    """Parses the table rows in bytes [start, end) of the file and counts their colors."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        contents = f.read(end - start).decode('utf-8')
+
+    soup = BeautifulSoup(contents, 'html.parser')
+    return Counter(_colors_from_rows(soup.find_all('tr')))
+
+def _row_chunks(file_path, n_chunks):
+    """
+    Splits the data rows of the first table into byte ranges starting at '<tr' tags.
+
+    Comments, processing instructions, CDATA sections and script/style bodies
+    are skipped the way html.parser skips them. Layouts the byte scan cannot
+    split safely (nested tables, a row opened before the previous one was
+    closed, an unterminated comment) are reported as None so the caller
+    parses serially.
+
+    Returns:
+        list: (start, end) byte offsets, or None if the file has no '<table>'
+            or cannot be split safely.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            in_table = False
+            in_row = False
+            end = len(mm)  # An unclosed table runs to the end of the document
+            rows = []
+            for token in _SPLIT_TOKEN_RE.finditer(mm):
+                if token.group('comment') or token.group('pi') or token.group('cdata') or token.group('raw'):
+                    continue
+                if token.group('unterminated'):
+                    return None
+                tag = token.group('tag').lower()
+                closing = bool(token.group('closing'))
+                if tag == b'table':
+                    if not closing and in_table:
+                        return None  # Nested table
+                    if not closing:
+                        in_table = True
+                    elif in_table:
+                        end = token.start()
+                        break
+                elif in_table and closing:
+                    in_row = False
+                elif in_table:
+                    # Without '</tr>', html.parser nests the next row inside
+                    # this one, which chunks parsed separately cannot reproduce.
+                    if in_row:
+                        return None
+                    in_row = True
+                    rows.append(token.start())
+            if not in_table:
+                return None
+
+    # Skip the first row, as scrape_color_data does with the header.
+    rows = rows[1:]
+    if not rows:
+        return []
+
+    step = max((end - rows[0]) // n_chunks, MIN_CHUNK_BYTES)
+    boundaries = [rows[0]]
+    while True:
+        index = bisect.bisect_left(rows, boundaries[-1] + step)
+        if index == len(rows):
+            break
+        boundaries.append(rows[index])
+    boundaries.append(end)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+def scrape_color_counts_parallel(file_path, workers=None):
+    """
+    Scrapes the color frequencies of one large HTML file using a process pool.
+
+    The first table is split at '<tr>' boundaries into byte ranges which are
+    parsed independently and their counts merged. Files the byte scan cannot
+    split safely (no table, nested tables, rows without '</tr>', an
+    unterminated comment) are scraped serially instead. The result then
+    equals Counter(scrape_color_data(file_path)), except that tag text inside
+    attribute values (e.g. title="<tr>") is not supported.
+
+    Args:
+        file_path (str or pathlib.Path): The path to the HTML file.
+        workers (int): Number of worker processes, at least 1 (defaults to the CPU count).
+
+    Returns:
+        collections.Counter: Mapping of color -> frequency, or exits the script on error.
+    """
+    file_path = Path(file_path)
+    if not file_path.is_file():
+        print(f"Error: The file '{file_path}' was not found.")
+        sys.exit(1)
+
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        # A few chunks per worker keeps the pool busy if rows are uneven.
+        chunks = _row_chunks(file_path, workers * 4)
+    except Exception as e:
+        print(f"Error reading or parsing the file '{file_path}': {e}")
+        sys.exit(1)
+    if chunks is None:
+        return Counter(scrape_color_data(file_path))
+
+    try:
+        color_counts = Counter()
+        if len(chunks) <= 1 or workers == 1:
+            for start, end in chunks:
+                color_counts.update(_count_colors_in_range(file_path, start, end))
+            return color_counts
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            starts, ends = zip(*chunks)
+            for counts in pool.map(_count_colors_in_range, [file_path] * len(chunks), starts, ends):
+                color_counts.update(counts)
+        return color_counts
+
+    except Exception as e:
+        print(f"Error reading or parsing the file '{file_path}': {e}")
+        sys.exit(1)
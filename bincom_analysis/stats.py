@@ -0,0 +1,131 @@
+#  Part 1: Analysis
+#
+#  Statistics over the scraped colors. compute_color_stats works on the
+#  color -> frequency counts only, so it costs O(distinct colors) however
+#  many rows were scraped; the same numbers can also be computed by the
+#  database (see StorageBackend.fetch_color_stats).
+
+from collections import Counter
+
+import numpy as np
+
+from .storage import connect_storage_backend, load_db_config, save_to_database
+
+
+def _color_at(sorted_counts, position):
+    """Returns the color at `position` of the alphabetically sorted, expanded color list."""
+    cumulative = 0
+    for color, freq in sorted_counts:
+        cumulative += freq
+        if cumulative > position:
+            return color
+    raise IndexError(position)
+
+def compute_color_stats(color_counts):
+    """
+    Computes the color statistics from the color frequencies.
+
+    Args:
+        color_counts (dict): Mapping of color -> frequency.
+
+    Returns:
+        dict: 'mode', 'median', 'variance', 'total' and 'probabilities'
+            (color -> probability), or None if there are no colors.
+    """
+    total = sum(color_counts.values())
+    if not total:
+        return None
+
+    # For categorical data, the "mean" is the mode (most frequent item).
+    # Ties go to the color that sorts first, as in fetch_color_stats.
+    mode = min(color_counts, key=lambda color: (-color_counts[color], color))
+
+    # The median of categorical data is the middle of the alphabetically
+    # sorted list; walking the sorted counts avoids sorting every color.
+    sorted_counts = sorted(color_counts.items())
+    if total % 2 == 0:
+        median = f"{_color_at(sorted_counts, total // 2 - 1)} and {_color_at(sorted_counts, total // 2)}"
+    else:
+        median = _color_at(sorted_counts, total // 2)
+
+    return {
+        'mode': mode,
+        'median': median,
+        'variance': float(np.var(list(color_counts.values()))),
+        'total': total,
+        'probabilities': {color: freq / total for color, freq in color_counts.items()},
+    }
+
+def print_color_stats(stats):
+    """Prints answers 1-5 of the test from a stats dict."""
+    # 1. Mean (Most Frequent) Color
+    print(f"1. Mean (Most Frequent) Color: {stats['mode']}")
+
+    # 2. Most Worn Color
+    print(f"2. Most Worn Color: {stats['mode']}")
+
+    # 3. Median Color
+    print(f"3. Median Color (alphabetically sorted): {stats['median']}")
+
+    # 4. Variance of Color Frequencies
+    print(f"4. Variance of Color Frequencies: {stats['variance']:.2f}")
+
+    # 5. Probability of choosing RED
+    prob_red = stats['probabilities'].get('RED', 0)
+    print(f"5. Probability of choosing RED: {prob_red:.2f} or {prob_red:.2%}")
+
+def analyze_colors(colors=None, from_database=False, accumulate=False):
+    """
+    Performs statistical analysis on the list of colors and saves the frequencies.
+
+    Args:
+        colors (list or collections.Counter): The scraped color strings, or
+            their frequencies as returned by scrape_color_counts_parallel.
+        from_database (bool): If True, ignore `colors` and compute the statistics
+            with SQL aggregates over the frequencies already stored in the database.
+        accumulate (bool): Add the frequencies to those already stored instead
+            of replacing them.
+    """
+    if from_database:
+        analyze_colors_from_database()
+        return
+
+    if not colors:
+        print("No colors found in the HTML file to analyze.")
+        return
+
+    print("\n--- T-Shirt Color Analysis ---")
+
+    color_counts = Counter(colors)
+    print_color_stats(compute_color_stats(color_counts))
+
+    # 6. Save to the configured database
+    save_to_database(color_counts, accumulate=accumulate)
+
+def analyze_colors_from_database():
+    """
+    Prints the color analysis using the aggregates computed by the database,
+    so the stored rows never have to be pulled back into Python.
+    """
+    print("\n--- T-Shirt Color Analysis (from database) ---")
+
+    db_config = load_db_config()
+    if not db_config:
+        print("   -> Skipping database analysis.")
+        return
+
+    backend = connect_storage_backend(db_config)
+    if backend is None:
+        return
+
+    try:
+        stats = backend.fetch_color_stats(colors=['RED'])
+        if stats is None:
+            print(f"No color frequencies stored in the {backend.name} database yet.")
+            return
+        print_color_stats(stats)
+
+    except Exception as e:
+        print(f"   -> Querying {backend.name} failed: {e}")
+    finally:
+        backend.close()
@@ -0,0 +1,403 @@
+#  Storage
+#
+#  Saves the color frequencies to the database configured in db_config.json.
+#  PostgreSQL and SQLite share one StorageBackend interface, selected by the
+#  'backend' key of the config.
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+try:
+    import psycopg2
+    import psycopg2.extras
+except ImportError:  # Only needed for the PostgreSQL backend
+    psycopg2 = None
+
+# Errors raised by StorageBackend.connect() when the database cannot be reached.
+# sqlite3.OperationalError also covers SQL errors, so these are only treated
+# as connection failures around connect() itself.
+DB_CONNECTION_ERRORS = (sqlite3.OperationalError,)
+if psycopg2 is not None:
+    DB_CONNECTION_ERRORS += (psycopg2.OperationalError,)
+
+# ON CONFLICT actions: replace the stored frequency with the new one, or add
+# the new count to it (running totals across several weekly files).
+REPLACE_FREQUENCY_SQL = "SET frequency = EXCLUDED.frequency"
+ACCUMULATE_FREQUENCY_SQL = "SET frequency = bincom_color_frequencies.frequency + EXCLUDED.frequency"
+
+
+def load_db_config(config_file='db_config.json'):
+    """Loads database configuration from a JSON file."""
+    config_path = Path(config_file)
+    if not config_path.is_file():
+        print(f"\nError: Database config file '{config_file}' not found.")
+        print("Please create it with your database credentials.")
+        return None
+    with config_path.open('r') as f:
+        return json.load(f)
+
+
+class StorageBackend(ABC):
+    """
+    Common interface for the databases the color frequencies can be saved to.
+
+    Subclasses provide the connection and the SQL dialect; the bulk upsert
+    and the statistics queries are shared so every backend stores and
+    reports the same data the same way.
+    """
+    name = "database"
+    placeholder = "?"
+    # Colors are ordered by code point, as Python's sorted() does, so the
+    # mode tie-break and the median match compute_color_stats.
+    color_order = "color"
+    create_table_sql = ""
+    # Index for frequency-ordered reads of the table, e.g. the top colors
+    create_index_sql = """
+        CREATE INDEX IF NOT EXISTS bincom_color_frequencies_freq_idx
+        ON bincom_color_frequencies (frequency DESC, color);
+    """
+    # View exposing per-color probability, cumulative frequency (for the
+    # median), the total count and the variance of the frequencies.
+    create_stats_sql = ""
+    # Run before create_stats_sql; plain views are cheap to recreate, so an
+    # older definition is always replaced.
+    drop_stats_sql = ""
+
+    def __init__(self, **params):
+        self.params = params
+        self.conn = None
+
+    @abstractmethod
+    def connect(self):
+        """Opens self.conn."""
+
+    def ensure_schema(self):
+        """Creates the frequencies table, its index and the stats view if missing."""
+        cur = self.conn.cursor()
+        cur.execute(self.create_table_sql)
+        cur.execute(self.create_index_sql)
+        if self.drop_stats_sql:
+            cur.execute(self.drop_stats_sql)
+        cur.execute(self.create_stats_sql)
+        self.conn.commit()
+        cur.close()
+
+    def refresh_stats(self, cur):
+        """Brings the stats view up to date after an ingest. Plain views need nothing."""
+        pass
+
+    def _upsert(self, cur, color_counts, accumulate):
+        cur.executemany(f"""
+            INSERT INTO bincom_color_frequencies (color, frequency)
+            VALUES ({self.placeholder}, {self.placeholder})
+            ON CONFLICT (color) DO UPDATE
+            {ACCUMULATE_FREQUENCY_SQL if accumulate else REPLACE_FREQUENCY_SQL};
+        """, list(color_counts.items()))
+
+    def write_changes(self, color_counts, removed=(), accumulate=False):
+        """
+        Deletes and upserts colors in one transaction, refreshing the stats once.
+
+        Args:
+            color_counts (dict): Mapping of color -> frequency to insert or update.
+            removed (iterable): Colors to delete, e.g. whose frequency dropped to zero.
+            accumulate (bool): Add to the stored frequencies instead of replacing them.
+        """
+        removed = list(removed)
+        cur = self.conn.cursor()
+        try:
+            if removed:
+                cur.executemany(f"DELETE FROM bincom_color_frequencies WHERE color = {self.placeholder};",
+                                [(color,) for color in removed])
+            if color_counts:
+                self._upsert(cur, color_counts, accumulate)
+            self.refresh_stats(cur)
+            self.conn.commit()
+        except Exception:
+            # Don't leave half a batch behind for the next commit on this connection.
+            self.conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+    def upsert_frequencies(self, color_counts, accumulate=False):
+        """
+        Inserts or updates all color frequencies in a single batch and commits.
+
+        Args:
+            color_counts (dict): Mapping of color -> frequency.
+            accumulate (bool): Add to the stored frequencies instead of replacing them.
+        """
+        self.write_changes(color_counts, accumulate=accumulate)
+
+    def delete_colors(self, colors):
+        """
+        Removes the given colors from the table and commits.
+
+        Args:
+            colors (iterable): Colors whose frequency has dropped to zero.
+        """
+        self.write_changes({}, removed=colors)
+
+    def fetch_color_stats(self, colors=None):
+        """
+        Computes the color statistics with SQL aggregates over the stored frequencies.
+
+        The stats view is refreshed first and every answer is read from it in
+        the same transaction, so they all describe one snapshot of the table
+        even if something other than this package has written to it.
+
+        Args:
+            colors (iterable): Colors to return probabilities for. None returns
+                every stored color, which reads the whole stats view.
+
+        Returns:
+            dict: 'mode', 'median', 'variance', 'total' and 'probabilities'
+                (color -> probability), or None if no frequencies are stored.
+        """
+        cur = self.conn.cursor()
+        try:
+            self.refresh_stats(cur)
+            stats = self._read_color_stats(cur, colors)
+            self.conn.commit()
+            return stats
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+    def _read_color_stats(self, cur, colors):
+        cur.execute("SELECT total, variance FROM bincom_color_stats LIMIT 1;")
+        row = cur.fetchone()
+        if row is None or not row[0]:
+            return None
+        total, variance = int(row[0]), float(row[1])
+
+        # Ties go to the color that sorts first.
+        cur.execute(f"""
+            SELECT color FROM bincom_color_stats
+            ORDER BY frequency DESC, {self.color_order} LIMIT 1;
+        """)
+        mode = cur.fetchone()[0]
+
+        # The median is the color whose cumulative (alphabetical) frequency
+        # first passes the middle position(s) of the expanded list.
+        def color_at(position):
+            cur.execute(f"""
+                SELECT color FROM bincom_color_stats
+                WHERE cum_frequency > {self.placeholder}
+                ORDER BY {self.color_order} LIMIT 1;
+            """, (position,))
+            return cur.fetchone()[0]
+
+        if total % 2 == 0:
+            median = f"{color_at(total // 2 - 1)} and {color_at(total // 2)}"
+        else:
+            median = color_at(total // 2)
+
+        if colors is None:
+            cur.execute("SELECT color, probability FROM bincom_color_stats;")
+            probabilities = {color: float(prob) for color, prob in cur.fetchall()}
+        else:
+            colors = list(colors)
+            probabilities = {}
+            if colors:
+                cur.execute(f"""
+                    SELECT color, probability FROM bincom_color_stats
+                    WHERE color IN ({', '.join([self.placeholder] * len(colors))});
+                """, colors)
+                probabilities = {color: float(prob) for color, prob in cur.fetchall()}
+
+        return {
+            'mode': mode,
+            'median': median,
+            'variance': variance,
+            'total': total,
+            'probabilities': probabilities,
+        }
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class PostgresBackend(StorageBackend):
+    """Stores the color frequencies in a PostgreSQL server via psycopg2."""
+    name = "PostgreSQL"
+    placeholder = "%s"
+    # Byte order instead of the database's locale collation
+    color_order = 'color COLLATE "C"'
+    create_table_sql = """
+        CREATE TABLE IF NOT EXISTS bincom_color_frequencies (
+            id SERIAL PRIMARY KEY,
+            color VARCHAR(50) UNIQUE NOT NULL,
+            frequency INTEGER NOT NULL
+        );
+    """
+    create_index_sql = """
+        CREATE INDEX IF NOT EXISTS bincom_color_frequencies_freq_idx
+        ON bincom_color_frequencies (frequency DESC, color COLLATE "C");
+    """
+    # Materialized so ingest pays for the aggregates; refreshed on every write
+    # and again before fetch_color_stats reads it.
+    create_stats_sql = """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS bincom_color_stats AS
+        SELECT color,
+               frequency,
+               frequency::float / SUM(frequency) OVER () AS probability,
+               SUM(frequency) OVER (ORDER BY color COLLATE "C") AS cum_frequency,
+               SUM(frequency) OVER () AS total,
+               VAR_POP(frequency) OVER () AS variance
+        FROM bincom_color_frequencies;
+    """
+
+    def connect(self):
+        if psycopg2 is None:
+            raise RuntimeError("psycopg2 is not installed (pip install psycopg2-binary).")
+        self.conn = psycopg2.connect(**self.params)
+
+    def _upsert(self, cur, color_counts, accumulate):
+        # execute_values sends the whole batch in one statement instead of
+        # one round trip per color.
+        psycopg2.extras.execute_values(cur, f"""
+            INSERT INTO bincom_color_frequencies (color, frequency)
+            VALUES %s
+            ON CONFLICT (color) DO UPDATE
+            {ACCUMULATE_FREQUENCY_SQL if accumulate else REPLACE_FREQUENCY_SQL};
+        """, list(color_counts.items()))
+
+    def refresh_stats(self, cur):
+        cur.execute("REFRESH MATERIALIZED VIEW bincom_color_stats;")
+
+
+class SQLiteBackend(StorageBackend):
+    """Stores the color frequencies in a local SQLite file, no server needed."""
+    name = "SQLite"
+    placeholder = "?"
+    create_table_sql = """
+        CREATE TABLE IF NOT EXISTS bincom_color_frequencies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            color VARCHAR(50) UNIQUE NOT NULL,
+            frequency INTEGER NOT NULL
+        );
+    """
+    # SQLite has no VAR_POP. The population variance is computed in two
+    # passes (mean first, then squared deviations), which stays exact for
+    # large accumulated frequencies where E[x^2] - E[x]^2 does not.
+    # Its default BINARY collation already orders colors by code point.
+    drop_stats_sql = "DROP VIEW IF EXISTS bincom_color_stats;"
+    create_stats_sql = """
+        CREATE VIEW bincom_color_stats AS
+        SELECT color,
+               frequency,
+               probability,
+               cum_frequency,
+               total,
+               AVG((frequency - mean) * (frequency - mean)) OVER () AS variance
+        FROM (
+            SELECT color,
+                   frequency,
+                   CAST(frequency AS REAL) / SUM(frequency) OVER () AS probability,
+                   SUM(frequency) OVER (ORDER BY color) AS cum_frequency,
+                   SUM(frequency) OVER () AS total,
+                   AVG(CAST(frequency AS REAL)) OVER () AS mean
+            FROM bincom_color_frequencies
+        );
+    """
+
+    def connect(self):
+        self.conn = sqlite3.connect(self.params.get('database', 'bincom_colors.db'))
+
+
+STORAGE_BACKENDS = {
+    'postgresql': PostgresBackend,
+    'sqlite': SQLiteBackend,
+}
+
+def get_storage_backend(db_config):
+    """
+    Builds the storage backend named by the 'backend' key of the database config.
+
+    Args:
+        db_config (dict): Parsed db_config.json. 'backend' defaults to 'postgresql';
+            the remaining keys are passed on as connection parameters.
+
+    Returns:
+        StorageBackend: An unconnected backend instance.
+    """
+    params = dict(db_config)
+    backend_name = params.pop('backend', 'postgresql').lower()
+    if backend_name not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown database backend '{backend_name}'. "
+                         f"Choose one of: {', '.join(STORAGE_BACKENDS)}")
+    return STORAGE_BACKENDS[backend_name](**params)
+
+def connect_storage_backend(db_config):
+    """
+    Builds and connects the configured storage backend and creates its schema.
+
+    Connection problems are reported here, so callers only need to handle
+    errors from the queries they run.
+
+    Args:
+        db_config (dict): Parsed db_config.json.
+
+    Returns:
+        StorageBackend: A connected backend, or None if it could not be set up.
+    """
+    try:
+        backend = get_storage_backend(db_config)
+    except ValueError as e:
+        print(f"   -> {e}")
+        return None
+
+    try:
+        backend.connect()
+    except DB_CONNECTION_ERRORS as e:
+        print(f"   -> Could not connect to the {backend.name} database: {e}")
+        print("   -> Please check the settings in 'db_config.json' and that the database is running.")
+        return None
+    except Exception as e:
+        print(f"   -> Could not open the {backend.name} database: {e}")
+        return None
+
+    try:
+        backend.ensure_schema()
+    except Exception as e:
+        print(f"   -> Could not create the {backend.name} tables: {e}")
+        backend.close()
+        return None
+    return backend
+
+def save_to_database(color_counts, accumulate=False):
+    """
+    Saves the color frequencies to the database configured in db_config.json.
+
+    Args:
+        color_counts (dict): Mapping of color -> frequency.
+        accumulate (bool): Add to the stored frequencies instead of replacing them.
+    """
+    print("\n--- Database ---")
+
+    db_config = load_db_config()
+    if not db_config:
+        print("   -> Skipping database operation.")
+        return
+
+    backend = connect_storage_backend(db_config)
+    if backend is None:
+        return
+
+    try:
+        print(f"6. Inserting/Updating color frequencies in the {backend.name} database...")
+        backend.upsert_frequencies(color_counts, accumulate=accumulate)
+        print(f"   -> Data saved to {backend.name} successfully.")
+
+    except Exception as e:
+        print(f"   -> Saving to {backend.name} failed: {e}")
+    finally:
+        backend.close()
@@ -0,0 +1,226 @@
+#  Watch mode
+#
+#  Polls a directory for new, modified or removed HTML exports, scrapes only
+#  those files, keeps the color totals up to date incrementally and writes
+#  just the colors whose frequency changed. Changes are debounced so a burst
+#  of files (or a file still being copied) is handled in one batch, and a
+#  batch is never held back longer than max_wait, even if changes keep coming.
+
+import hashlib
+import time
+from collections import Counter
+from pathlib import Path
+
+from .scraping import _read_colors
+from .stats import compute_color_stats, print_color_stats
+from .storage import connect_storage_backend, load_db_config
+
+
+def _file_digest(file_path):
+    """Returns the SHA-1 of the file contents, read in 1 MiB blocks."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DirectoryWatcher:
+    """
+    Keeps running color totals for the HTML files in a directory.
+
+    Each file's counts are remembered, so a modified file only replaces its
+    own contribution and a removed file is subtracted from the totals.
+    """
+
+    def __init__(self, directory, pattern='*.html', poll_interval=1.0, debounce=2.0, max_wait=30.0,
+                 save=True):
+        if debounce < 0 or max_wait < 0:
+            raise ValueError("debounce and max_wait must not be negative")
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.max_wait = max_wait
+        self.save = save
+
+        self.pending = set()    # changed paths waiting for the next flush
+        self.first_change = 0.0
+        self.last_change = 0.0
+
+        self.totals = Counter()
+        self.file_counts = {}   # path -> Counter of that file's colors
+        self.file_hashes = {}   # path -> digest of the contents last scraped
+        self.snapshots = {}     # path -> (mtime_ns, size) last seen by scan()
+        self.unsaved = {}       # color -> total not yet written to the database
+
+    def scan(self):
+        """
+        Compares the directory with the previous scan.
+
+        Returns:
+            set: Paths that were added, modified or removed since the last scan.
+        """
+        current = {}
+        for path in self.directory.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            current[path] = (stat.st_mtime_ns, stat.st_size)
+
+        changed = {path for path, snapshot in current.items() if self.snapshots.get(path) != snapshot}
+        changed |= self.snapshots.keys() - current.keys()
+        self.snapshots = current
+        return changed
+
+    def process(self, paths):
+        """
+        Re-scrapes the given files and updates the running totals.
+
+        Files whose contents hash the same as last time are skipped; files
+        that cannot be parsed yet keep their previous counts.
+
+        Returns:
+            dict: Color -> new total for every color whose total changed.
+        """
+        old_totals = Counter(self.totals)
+
+        for path in sorted(paths):
+            if not path.is_file():
+                self.file_hashes.pop(path, None)
+                self.totals.subtract(self.file_counts.pop(path, Counter()))
+                continue
+
+            try:
+                digest = _file_digest(path)
+                if digest == self.file_hashes.get(path):
+                    continue
+                new_counts = Counter(_read_colors(path))
+            except Exception as e:
+                print(f"   -> Skipping '{path}': {e}")
+                continue
+
+            self.totals.subtract(self.file_counts.get(path, Counter()))
+            self.totals.update(new_counts)
+            self.file_counts[path] = new_counts
+            self.file_hashes[path] = digest
+
+        self.totals = +self.totals  # Drop colors whose count fell to zero
+        return {color: self.totals[color]
+                for color in old_totals.keys() | self.totals.keys()
+                if old_totals[color] != self.totals[color]}
+
+    def push_changes(self, changes):
+        """
+        Writes the changed totals to the configured database in one transaction.
+
+        Returns:
+            bool: True if the changes were committed.
+        """
+        db_config = load_db_config()
+        if not db_config:
+            print("   -> Skipping database operation.")
+            return False
+
+        backend = connect_storage_backend(db_config)
+        if backend is None:
+            return False
+
+        try:
+            removed = [color for color, freq in changes.items() if freq == 0]
+            updated = {color: freq for color, freq in changes.items() if freq}
+            backend.write_changes(updated, removed=removed)
+            print(f"   -> {len(changes)} color frequencies saved to {backend.name}.")
+            return True
+
+        except Exception as e:
+            print(f"   -> Saving to {backend.name} failed: {e}")
+            return False
+        finally:
+            backend.close()
+
+    def flush(self, paths):
+        """Processes one debounced batch of changed files."""
+        print(f"\n--- Processing {len(paths)} changed file(s) in '{self.directory}' ---")
+        changes = self.process(paths)
+        if changes:
+            stats = compute_color_stats(self.totals)
+            if stats:
+                print_color_stats(stats)
+        else:
+            print("   -> No color frequencies changed.")
+
+        if not self.save:
+            return
+        # Changes from batches whose write failed are retried with this one;
+        # the values are totals, so newer ones simply replace older ones.
+        self.unsaved.update(changes)
+        if self.unsaved:
+            if self.push_changes(self.unsaved):
+                self.unsaved = {}
+            else:
+                print(f"   -> {len(self.unsaved)} color frequencies will be retried with the next batch.")
+
+    def poll(self, now):
+        """
+        Scans once and flushes the pending batch if it is due.
+
+        A batch is due once no change has been seen for `debounce` seconds,
+        or once its first change is `max_wait` seconds old, so a directory
+        that never goes quiet is still written regularly.
+
+        Args:
+            now (float): The current time.monotonic() value.
+
+        Returns:
+            bool: True if a batch was flushed.
+        """
+        changed = self.scan()
+        if changed:
+            if not self.pending:
+                self.first_change = now
+            # Files still being written keep changing, which pushes the
+            # flush back until they have settled (or max_wait is reached).
+            self.pending |= changed
+            self.last_change = now
+
+        if not self.pending:
+            return False
+        if now - self.last_change < self.debounce and now - self.first_change < self.max_wait:
+            return False
+
+        self.flush(self.pending)
+        self.pending = set()
+        return True
+
+    def run(self):
+        """Polls the directory until interrupted with Ctrl+C."""
+        print(f"Watching '{self.directory}' for {self.pattern} files (Ctrl+C to stop)...")
+        try:
+            while True:
+                self.poll(time.monotonic())
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+
+def watch_directory(directory, pattern='*.html', poll_interval=1.0, debounce=2.0, max_wait=30.0,
+                    save=True):
+    """
+    Watches a directory and incrementally re-analyzes changed HTML files.
+
+    Args:
+        directory (str or pathlib.Path): Directory the exports are written to.
+        pattern (str): Glob pattern of the files to analyze.
+        poll_interval (float): Seconds between directory scans.
+        debounce (float): Seconds without further changes before a batch is processed.
+        max_wait (float): Seconds after its first change by which a batch is
+            processed even if changes keep arriving.
+        save (bool): Write the changed frequencies to the configured database.
+    """
+    if not Path(directory).is_dir():
+        print(f"Error: The directory '{directory}' does not exist.")
+        return
+    DirectoryWatcher(directory, pattern, poll_interval, debounce=debounce, max_wait=max_wait,
+                     save=save).run()
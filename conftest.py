@@ -0,0 +1 @@
+# Lets the tests in tests/ import the bincom_analysis package from the repository root.
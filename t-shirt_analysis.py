@@ -6,30 +6,10 @@
 #:      We are planning to produce Tshirts for staffs and we have issues deciding the colors to be used. 
 #:      We want to make our decision based on the analysis of the data presented in the web page.
 #: You can use re
+#:
+#:  The solutions to the questions below live in the bincom_analysis package.
 
-from bs4 import BeautifulSoup
-
-import csv
-import os
-import numpy as np
-import re
-import sys
-
-# Target(color) Names
-colours = ['ARSH', 'RED', 'BLUE', 'CREAM', 'BROWN', 'GREEN', 'YELLOW', 'ORANGE', 'PINK', 'WHITE']
-
-# Dataset
-data = {'DAY' : ['MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY'], \
-        'COLOURS' : ['ARSH', 'RED', 'BLUE', 'CREAM', 'BROWN', 'GREEN', 'YELLOW', 'ORANGE', 'PINK', 'WHITE']}
-data_pandas = pd.DataFrame(data)
-try:
-    print(data_pandas)
-except Exception as e:
-    print(f'{e}')
-
-# Dataset scrape from html
-def table_data():
-    pass
+from bincom_analysis.cli import main
 
 #Key Features:
 #TODO: 1.      Which color of shirt is the mean color?
@@ -49,3 +29,8 @@ def table_data():
 #TODO:  8.      Write a program that generates random 4 digits number of 0s and 1s and convert the generated number to base 10.
 
 #TODO:  9.      Write a program to sum the first 50 fibonacci sequence.
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+from collections import Counter
+
+import pytest
+
+from bincom_analysis import scrape_color_counts_parallel, scrape_color_data
+from bincom_analysis import scraping
+
+COLORS = ['RED', 'BLUE', 'GREEN', 'WHITE', 'PINK', 'Cream ', 'blue']
+
+
+def make_rows(n):
+    return ''.join(
+        f'<tr><td>DAY{i}</td><td>{", ".join(COLORS[(i + j) % len(COLORS)] for j in range(i % 5))},</td></tr>\n'
+        for i in range(n)
+    )
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Make even a small test file split into several chunks.
+    monkeypatch.setattr(scraping, 'MIN_CHUNK_BYTES', 64)
+
+
+def write_html(tmp_path, html):
+    path = tmp_path / 'export.html'
+    path.write_text(html, encoding='utf-8')
+    return path
+
+
+def assert_same_as_serial(path):
+    assert scrape_color_counts_parallel(path, workers=2) == Counter(scrape_color_data(path))
+
+
+def test_multi_chunk_file_matches_serial(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<html><body><table>\n<tr><th>DAY</th><th>COLOURS</th></tr>\n'
+                                + make_rows(200) + '</table></body></html>')
+    assert len(scraping._row_chunks(path, 8)) > 1
+    assert_same_as_serial(path)
+
+
+def test_header_outside_tr_skips_first_row_like_serial(tmp_path, small_chunks):
+    # As in python_class_question.html: the header is a <thead> without <tr>.
+    path = write_html(tmp_path, '<table><thead><th>DAY</th></thead><tbody>\n'
+                                + make_rows(50) + '</tbody></table>')
+    assert_same_as_serial(path)
+
+
+def test_sample_file_matches_serial():
+    assert_same_as_serial('python_class_question.html')
+
+
+def test_commented_out_table_is_ignored(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<!-- <table><tr><td>x</td><td>PINK</td></tr></table> -->\n'
+                                '<table><tr><td>h</td><td>h</td></tr>\n'
+                                '<tr><td>a</td><td>RED, RED, BLUE</td></tr></table>')
+    assert scrape_color_counts_parallel(path, workers=2) == Counter({'RED': 2, 'BLUE': 1})
+    assert_same_as_serial(path)
+
+
+def test_script_and_comment_tags_inside_table_are_ignored(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<table><tr><td>h</td><td>h</td></tr>\n'
+                                + make_rows(20)
+                                + '<!-- <tr><td>x</td><td>PINK</td></tr> </table> -->\n'
+                                + '<script>var s = "<tr></table>";</script>\n'
+                                + make_rows(20) + '</table>')
+    assert_same_as_serial(path)
+
+
+def test_nested_table_falls_back_to_serial(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<table><tr><td>h</td><td>h</td></tr>\n'
+                                '<tr><td>a</td><td>RED<table><tr><td>A</td></tr></table></td></tr>\n'
+                                + make_rows(20) + '</table>')
+    assert scraping._row_chunks(path, 4) is None
+    assert_same_as_serial(path)
+
+
+def test_rows_without_end_tags_fall_back_to_serial(tmp_path, small_chunks):
+    rows = ''.join(f'<tr><td>D{i}<td>{", ".join(COLORS[:i % 4 + 1])}\n' for i in range(20))
+    path = write_html(tmp_path, '<table><tr><th>DAY</th><th>COLOURS</th></tr>\n' + rows + '</table>')
+    assert scraping._row_chunks(path, 8) is None
+    assert_same_as_serial(path)
+
+
+def test_processing_instructions_and_cdata_are_ignored(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<table><tr><td>h</td><td>h</td></tr>\n'
+                                + make_rows(20)
+                                + '<?php echo "<tr><td>x</td><td>PINK</td></tr>" ?>\n'
+                                + '<![CDATA[<tr><td>x</td><td>PINK</td></tr></table>]]>\n'
+                                + make_rows(20) + '</table>')
+    assert len(scraping._row_chunks(path, 8)) > 1
+    assert_same_as_serial(path)
+
+
+def test_unclosed_table_and_uppercase_tags(tmp_path, small_chunks):
+    path = write_html(tmp_path, '<TABLE><TR><TD>h</TD><TD>h</TD></TR>\n'
+                                + make_rows(30).replace('<tr>', '<TR class="r">'))
+    assert_same_as_serial(path)
+
+
+def test_no_data_rows(tmp_path):
+    path = write_html(tmp_path, '<table><tr><td>h</td><td>RED</td></tr></table>')
+    assert scrape_color_counts_parallel(path, workers=2) == Counter()
+
+
+def test_rejects_less_than_one_worker(tmp_path):
+    path = write_html(tmp_path, '<table></table>')
+    with pytest.raises(ValueError):
+        scrape_color_counts_parallel(path, workers=0)
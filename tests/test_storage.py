@@ -0,0 +1,113 @@
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from bincom_analysis import SQLiteBackend, compute_color_stats, get_storage_backend
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = get_storage_backend({'backend': 'sqlite', 'database': str(tmp_path / 'colors.db')})
+    backend.connect()
+    backend.ensure_schema()
+    yield backend
+    backend.close()
+
+
+def stored(backend):
+    return dict(backend.conn.execute("SELECT color, frequency FROM bincom_color_frequencies").fetchall())
+
+
+def test_config_selects_sqlite_backend(tmp_path):
+    backend = get_storage_backend({'backend': 'SQLite', 'database': str(tmp_path / 'x.db')})
+    assert isinstance(backend, SQLiteBackend)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_storage_backend({'backend': 'mysql'})
+
+
+def test_upsert_replaces_frequencies(backend):
+    backend.upsert_frequencies({'RED': 3, 'BLUE': 2})
+    backend.upsert_frequencies({'RED': 5})
+    assert stored(backend) == {'RED': 5, 'BLUE': 2}
+
+
+def test_upsert_accumulates_frequencies(backend):
+    backend.upsert_frequencies({'RED': 3, 'BLUE': 2})
+    backend.upsert_frequencies({'RED': 5, 'GREEN': 1}, accumulate=True)
+    assert stored(backend) == {'RED': 8, 'BLUE': 2, 'GREEN': 1}
+
+
+def test_delete_colors(backend):
+    backend.upsert_frequencies({'RED': 3, 'BLUE': 2})
+    backend.delete_colors(['RED'])
+    assert stored(backend) == {'BLUE': 2}
+
+
+def test_fetch_color_stats_empty_table(backend):
+    assert backend.fetch_color_stats() is None
+
+
+@pytest.mark.parametrize('colors', [
+    ['GREEN', 'YELLOW', 'GREEN', 'BROWN', 'BLUE', 'PINK', 'BLUE', 'RED', 'WHITE', 'BLUE'],
+    ['RED', 'RED', 'BLUE', 'BLUE', 'ZED'],      # tie for the mode
+    ['RED', 'BLUE', 'BLUE', 'RED'],             # even count: two middle colors
+    ['Zed', 'apple', 'Apple', 'zed', 'zed'],    # code-point order, not case-insensitive
+])
+def test_fetch_color_stats_matches_compute_color_stats(backend, colors):
+    color_counts = Counter(colors)
+    backend.upsert_frequencies(color_counts)
+
+    expected = compute_color_stats(color_counts)
+    actual = backend.fetch_color_stats()
+
+    assert actual['mode'] == expected['mode']
+    assert actual['median'] == expected['median']
+    assert actual['total'] == expected['total']
+    assert actual['variance'] == pytest.approx(expected['variance'])
+    assert actual['probabilities'] == pytest.approx(expected['probabilities'])
+
+
+def test_fetch_color_stats_only_requested_probabilities(backend):
+    backend.upsert_frequencies({'RED': 1, 'BLUE': 3})
+    stats = backend.fetch_color_stats(colors=['RED', 'PURPLE'])
+    assert stats['probabilities'] == {'RED': pytest.approx(0.25)}
+
+
+def test_write_changes_deletes_and_upserts_in_one_transaction(backend):
+    backend.upsert_frequencies({'RED': 3, 'BLUE': 2})
+    backend.write_changes({'BLUE': 4, 'GREEN': 1}, removed=['RED'])
+    assert stored(backend) == {'BLUE': 4, 'GREEN': 1}
+
+    # A failing upsert must roll back its delete, so a later successful
+    # write on the same connection does not commit it.
+    with pytest.raises(sqlite3.IntegrityError):
+        backend.write_changes({None: 1}, removed=['BLUE'])
+    backend.write_changes({'GREEN': 2})
+    assert stored(backend) == {'BLUE': 4, 'GREEN': 2}
+
+
+def test_variance_of_large_frequencies(backend):
+    color_counts = {'RED': 100000000, 'BLUE': 100000001, 'GREEN': 100000002}
+    backend.upsert_frequencies(color_counts)
+    assert backend.fetch_color_stats()['variance'] == pytest.approx(compute_color_stats(color_counts)['variance'])
+
+
+def test_ensure_schema_replaces_an_older_stats_view(backend):
+    backend.conn.execute("DROP VIEW bincom_color_stats")
+    backend.conn.execute("CREATE VIEW bincom_color_stats AS SELECT 1 AS outdated")
+    backend.ensure_schema()
+    backend.upsert_frequencies({'RED': 1, 'BLUE': 3})
+    assert backend.fetch_color_stats()['total'] == 4
+
+
+def test_fetch_color_stats_sees_rows_written_outside_the_backend(backend):
+    backend.upsert_frequencies({'RED': 1, 'BLUE': 3})
+    backend.conn.execute("INSERT INTO bincom_color_frequencies (color, frequency) VALUES ('GREEN', 10)")
+    backend.conn.commit()
+    stats = backend.fetch_color_stats(colors=['GREEN'])
+    assert (stats['mode'], stats['total']) == ('GREEN', 14)
+    assert stats['probabilities'] == {'GREEN': pytest.approx(10 / 14)}
@@ -0,0 +1,146 @@
+import json
+import os
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from bincom_analysis import DirectoryWatcher
+
+
+def table(*rows):
+    body = ''.join(f'<tr><td>DAY</td><td>{colors}</td></tr>\n' for colors in rows)
+    return f'<table><tr><th>DAY</th><th>COLOURS</th></tr>\n{body}</table>'
+
+
+class Exports:
+    """Writes HTML exports with explicit, increasing mtimes so no sleeps are needed."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.clock = 1_000_000_000
+
+    def write(self, name, html):
+        path = self.directory / name
+        path.write_text(html, encoding='utf-8')
+        self.touch(name)
+        return path
+
+    def touch(self, name):
+        self.clock += 1_000_000_000
+        os.utime(self.directory / name, ns=(self.clock, self.clock))
+
+
+@pytest.fixture
+def exports(tmp_path):
+    directory = tmp_path / 'exports'
+    directory.mkdir()
+    return Exports(directory)
+
+
+@pytest.fixture
+def watcher(exports):
+    return DirectoryWatcher(exports.directory, save=False)
+
+
+def test_new_file(exports, watcher):
+    path = exports.write('mon.html', table('RED, BLUE', 'BLUE'))
+    assert watcher.scan() == {path}
+    assert watcher.process({path}) == {'RED': 1, 'BLUE': 2}
+    assert watcher.totals == Counter({'RED': 1, 'BLUE': 2})
+    assert watcher.scan() == set()
+
+
+def test_modified_file_replaces_its_own_counts(exports, watcher):
+    mon = exports.write('mon.html', table('RED, BLUE'))
+    tue = exports.write('tue.html', table('RED'))
+    watcher.process(watcher.scan())
+
+    exports.write('mon.html', table('RED, GREEN, GREEN'))
+    assert watcher.scan() == {mon}
+    assert watcher.process({mon}) == {'BLUE': 0, 'GREEN': 2}
+    assert watcher.totals == Counter({'RED': 2, 'GREEN': 2})
+    assert tue in watcher.file_counts
+
+
+def test_touched_file_with_same_contents_is_skipped(exports, watcher, monkeypatch):
+    path = exports.write('mon.html', table('RED'))
+    watcher.process(watcher.scan())
+
+    exports.touch('mon.html')
+    assert watcher.scan() == {path}
+
+    def fail(_path):
+        raise AssertionError("unchanged file was scraped again")
+    monkeypatch.setattr('bincom_analysis.watch._read_colors', fail)
+    assert watcher.process({path}) == {}
+    assert watcher.totals == Counter({'RED': 1})
+
+
+def test_removed_file_drops_colors_to_zero(exports, watcher):
+    exports.write('mon.html', table('RED, BLUE'))
+    tue = exports.write('tue.html', table('BLUE, PINK'))
+    watcher.process(watcher.scan())
+
+    tue.unlink()
+    assert watcher.scan() == {tue}
+    assert watcher.process({tue}) == {'BLUE': 1, 'PINK': 0}
+    assert watcher.totals == Counter({'RED': 1, 'BLUE': 1})
+    assert 'PINK' not in watcher.totals
+    assert tue not in watcher.file_counts
+
+
+def test_unparseable_file_is_skipped_and_retried(exports, watcher):
+    path = exports.write('mon.html', '<html>still being cop')
+    assert watcher.process(watcher.scan()) == {}
+    assert path not in watcher.file_counts
+
+    exports.write('mon.html', table('RED'))
+    assert watcher.process(watcher.scan()) == {'RED': 1}
+
+
+def test_failed_write_is_retried_with_next_batch(exports, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / 'db_config.json'
+    database = tmp_path / 'colors.db'
+    watcher = DirectoryWatcher(exports.directory)
+
+    config.write_text(json.dumps({'backend': 'sqlite', 'database': str(tmp_path / 'missing' / 'x.db')}))
+    exports.write('mon.html', table('RED, BLUE'))
+    watcher.flush(watcher.scan())
+    assert watcher.unsaved == {'RED': 1, 'BLUE': 1}
+
+    config.write_text(json.dumps({'backend': 'sqlite', 'database': str(database)}))
+    exports.write('tue.html', table('BLUE'))
+    watcher.flush(watcher.scan())
+    assert watcher.unsaved == {}
+
+    stored = dict(sqlite3.connect(database).execute("SELECT color, frequency FROM bincom_color_frequencies"))
+    assert stored == {'RED': 1, 'BLUE': 2}
+
+
+def test_batch_waits_for_debounce(exports):
+    watcher = DirectoryWatcher(exports.directory, debounce=2.0, max_wait=30.0, save=False)
+    exports.write('mon.html', table('RED'))
+    assert not watcher.poll(now=100.0)
+    assert not watcher.poll(now=101.0)
+    assert watcher.poll(now=102.0)
+    assert watcher.totals == Counter({'RED': 1})
+    assert watcher.pending == set()
+
+
+def test_busy_directory_is_flushed_after_max_wait(exports):
+    watcher = DirectoryWatcher(exports.directory, debounce=2.0, max_wait=5.0, save=False)
+    flushed = []
+    for second in range(8):
+        # A new change arrives every poll, so the debounce never expires.
+        exports.write(f'day{second}.html', table('RED'))
+        flushed.append(watcher.poll(now=100.0 + second))
+    assert flushed == [False] * 5 + [True, False, False]
+    assert watcher.totals == Counter({'RED': 6})
+    assert len(watcher.pending) == 2
+
+
+def test_negative_debounce_is_rejected(exports):
+    with pytest.raises(ValueError):
+        DirectoryWatcher(exports.directory, debounce=-1)